@@ -23,30 +23,53 @@ Arguments:
     -sp, --skip-prompt (bool): Skip adding the additional prompt content at the beginning.
     -pf, --prompt-file (str): Path to a file containing the prompt content to include at the beginning.
     -c, --copy (bool): Copy the output to the clipboard.
+    -ca, --copy-all (bool): Copy the whole output to the clipboard at once instead of chunk by chunk.
     -r, --recursive (bool): Recursively search directories for files matching the patterns.
     -ex, --exclude (list of str): Patterns of files to exclude.
     -cs, --chunk-size (int): Chunk size for splitting the output file (default: 150000).
+    -wc, --write-chunks (bool): Also write each chunk to its own file.
     -d, --delete-chunks (bool): Delete chunk files after copying to clipboard.
 
 Output:
     The script produces a markdown file with the following features:
     - A visual representation of the directory structure of the input files.
     - Concatenated contents of each file, with appropriate markdown syntax highlighting based on file type.
-    - Optionally splits the output into chunks with end-of-part messages and continuation notices.
+    - Splits the output into chunks with end-of-part messages and continuation notices, optionally
+      writing each chunk to its own file.
     - Optionally copies the output or chunks to the clipboard.
     - Optionally deletes the chunk files after copying to clipboard.
 """
 
 import os
+import io
 import argparse
+import fnmatch
+import re
 import logging
 import platform
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import glob
 
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
 # Constants
 CHUNK_SIZE = 100000
+PARALLEL_READ_MIN_FILES = 4  # Read fewer files than this sequentially
+MAX_READ_WORKERS = 32
+
+# Resolved once at import instead of on every clipboard copy
+SYSTEM = platform.system()
+CLIPBOARD_COMMANDS = {
+    'Linux': ['xclip', '-selection', 'clipboard'],
+    'Darwin': ['pbcopy'],  # macOS
+    'Windows': ['clip'],
+}
 
 FILE_TYPE_LANGUAGES = {
     '.py': 'python',
@@ -295,9 +318,231 @@ FILE_TYPE_LANGUAGES = {
     '.xquery': 'xquery'
 }
 
+# LLM prompt written at the beginning of the output unless skipped
+PROMPT_TEMPLATE = '''\
+You are a super helpful coding assistant!
+
+Instructions:
+
+Below you will find relevant files for a project I am working on. Please analyze these different files and confirm that you understand their purpose. I will provide multiple files, and I will let you know when the final file is provided. Do not offer updates or show me code at this time. If you do not understand something, please ask me questions for clarification.
+
+
+# When providing code help, please adhere to the following guidelines
+
+1. **Provide Code in Sections**: Do not provide whole files. Instead, provide specific sections, functions, or lines as needed.
+
+2. **Example for Line Changes**:
+    - Change this line:
+
+      ```python
+      Old line here
+      ```
+
+    - To this:
+
+      ```python
+      New line here
+      ```
+
+**Note**: When providing markdown code boxes, escape internal backticks by using triple backslashes before the backticks.
+
+## Style Guide for Writing Tools
+
+### 1. **Introduction**
+
+- Purpose of the Style Guide
+- Importance of Consistency
+
+## 2. **Script Header**
+
+- **Script Name Comment**: Include the name of the script at the top as a comment. This helps identify the log and output files.
+
+  ```python
+  # script_name.py
+  ```
+
+- **Summary Comment**: Include a brief summary of the script's purpose and functionality in comments at the top, after the filename and a line break.
+
+  ```python
+  # script_name.py
+
+  # This script combines multiple text files into a single text file.
+  # It prompts the user for the directory containing the text files,
+  # reads each file, and writes their contents into an output file.
+  ```
+
+## 3. **Imports**
+
+- **Grouping Imports**: Group imports in the following order: standard library imports, related third-party imports, local application/library-specific imports.
+- **Absolute Imports**: Use absolute imports when possible.
+
+## 4. **Configuration Management**
+
+- **Configuration Files**: Use configuration files for storing settings that might change frequently. This can help make your scripts more flexible and easier to manage.
+
+  ```python
+  import json
+
+  def load_config(config_file):
+      """Load configuration settings from a file."""
+      with open(config_file, 'r') as f:
+          config = json.load(f)
+      return config
+  ```
+
+## 5. **Function Definitions**
+
+- **Comment Titles**: Provide a concise title for every function as a comment above the function. Example:
+
+  ```python
+  # Data processing
+  def process_data(data):
+    """
+    Process the given data.
+
+    Parameters:
+        data (list): A list of data items to be processed.
+
+    Returns:
+        list: The processed data.
+    """
+    print(f"Processing data: {data}")
+    processed_data = [item * 2 for item in data]
+    print("Data processing complete.")
+    return processed_data
+  ```
+
+- **Function Docstrings**: Provide a clear explanation of the function's purpose, parameters, and return values. Example:
+
+  ```python
+  # Example function
+  def example_function(param1, param2):
+      """
+      Brief description of the function.
+
+      Parameters:
+          param1 (type): Description of param1.
+          param2 (type): Description of param2.
+      
+      Returns:
+          return_type: Description of the return value.
+      """
+  ```
+
+- **Modular Code**: Break down tasks into small, reusable functions.
+
+## 6. **Code Formatting**
+
+- **Indentation**: Use 4 spaces for indentation.
+- **Line Length**: Limit all lines to a maximum of 79 characters.
+- **Blank Lines**: Use blank lines to separate top-level function and class definitions.
+- **String Quotes**: In general, use single quotes for short strings and double quotes for longer strings or when a string contains a single quote.
+- **Whitespace in Expressions and Statements**:
+  - Avoid extraneous whitespace in the following situations: immediately inside parentheses, brackets or braces; immediately before a comma, semicolon, or colon; immediately before the open parenthesis that starts the argument list of a function call.
+  - Use a single space around binary operators and after a comma.
+- **Naming Conventions**:
+  - Use `CamelCase` for class names.
+  - Use `lower_case_with_underscores` for functions and variable names.
+  - Use `UPPER_CASE_WITH_UNDERSCORES` for constants.
+
+## 7. **Commenting**
+
+- **Inline Comments**: Use comments to explain complex logic or important sections of code.
+
+  ```python
+  # This loop processes each file in the directory
+  for file in files:
+      ...
+  ```
+
+## 8. **Logging**
+
+- **Setup Logging**: Configure logging to output to both the console and a log file in the `./logs` directory. The log file should be named according to the script name.
+
+  ```python
+  def setup_logging(script_name):
+      """Setup logging configuration."""
+      log_dir = './logs'
+      os.makedirs(log_dir, exist_ok=True)
+      log_file = os.path.join(log_dir, f'{script_name}.log')
+
+      logging.basicConfig(level=logging.DEBUG,
+                          format='%(asctime)s - %(levelname)s - %(message)s',
+                          handlers=[
+                              logging.FileHandler(log_file),
+                              logging.StreamHandler()
+                          ])
+  ```
+
+- **Logging Levels**: Use appropriate logging levels (`DEBUG`, `INFO`, `ERROR`) to provide detailed and useful log messages.
+
+    ```python
+    logging.debug(f"Processing file: {file_path}")
+    logging.info("Operation completed successfully.")
+    logging.error(f"Error processing file: {e}")
+    ```
+
+## 9. **Error Handling**
+
+- **Try-Except Blocks**: Use try-except blocks to handle potential errors gracefully.
+
+    ```python
+    try:
+        # code that may raise an exception
+    except Exception as e:
+        logging.error(f"An error occurred: {e}")
+    ```
+
+- **Using Whole New Functions**: Implement whole new functions within try-except blocks to keep the code modular and maintainable.
+
+## 10. **Testing and Debugging**
+
+- **Unit Tests**: Write unit tests for your functions to ensure they work correctly.
+
+  ```python
+  import unittest
+
+  class TestExampleFunction(unittest.TestCase):
+      def test_example_function(self):
+          self.assertEqual(example_function(param1, param2), expected_result)
+
+  if __name__ == '__main__':
+      unittest.main()
+  ```
+
+## 12. **PEP 8 Compliance**
+
+- Summary of Key Points
+  - **Indentation**: Use 4 spaces per indentation level.
+  - **Line Length**: Limit all lines to a maximum of 79 characters.
+  - **Blank Lines**: Use blank lines to separate top-level function and class definitions.
+  - **Imports**:
+    - Imports should usually be on separate lines.
+    - Group imports in the following order: standard library imports, related third-party imports, local application/library-specific imports.
+    - Use absolute imports when possible.
+  - **String Quotes**: In general, use single quotes for short strings and double quotes for longer strings or when a string contains a single quote.
+  - **Whitespace in Expressions and Statements**:
+    - Avoid extraneous whitespace in the following situations: immediately inside parentheses, brackets or braces; immediately before a comma, semicolon, or colon; immediately before the open parenthesis that starts the argument list of a function call.
+    - Use a single space around binary operators and after a comma.
+  - **Naming Conventions**:
+    - Use `CamelCase` for class names.
+    - Use `lower_case_with_underscores` for functions and variable names.
+    - Use `UPPER_CASE_WITH_UNDERSCORES` for constants.
+
+Remember to follow the guidelines provided in the style guide to maintain consistency and readability in the code.
+
+INSTRUCTION I am senging multiple parts, please confirm receipt of the files and let me know when you are ready for the next part.  Do not do anything else until you have all the parts.
+
+'''
+PROMPT_BYTES = PROMPT_TEMPLATE.encode('utf-8')  # Encoded once, the prompt never changes
+
 # Sets up logging
 def setup_logging(script_name):
     """Setup logging configuration to output logs to a file and console."""
+    # Only configure once; basicConfig would ignore a second call after opening another log file
+    if logging.getLogger().handlers:
+        return
+
     log_dir = './logs'
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, f'{script_name}.log')
@@ -309,32 +554,60 @@ def setup_logging(script_name):
                             logging.StreamHandler()
                         ])
 
-# Directory structure
-def generate_directory_structure(files):
+# Resolve files
+def resolve_files(files, root):
     """
-    Generates a text representation of the directory structure for the given files.
+    Computes each file's path relative to the root directory and its file type once,
+    so later passes over the files don't repeat the work.
 
     Parameters:
         files (list of str): List of file paths.
+        root (str): The directory the paths are shown relative to.
 
     Returns:
-        list of str: Directory structure lines.
+        list of tuple: (file path, relative path, file type) tuples. Files outside
+        the root keep their absolute path.
     """
-    structure = []
-    root = Path('.').resolve()
+    resolved_files = []
     for file in files:
-        path = Path(file).resolve()
         try:
-            relative_path = path.relative_to(root)
+            relative_path = os.path.relpath(file, root)
         except ValueError:
-            relative_path = path
-        parts = list(relative_path.parts)
-        for i in range(len(parts)):
-            part = parts[:i + 1]
-            line = '│   ' * (len(part) - 1) + '├── ' + part[-1]
-            if line not in structure:
-                structure.append(line)
-    return structure
+            relative_path = os.pardir  # On Windows, a file on another drive has no relative path
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            relative_path = os.path.realpath(file)  # If the path is not relative, use the absolute path
+        resolved_files.append((file, relative_path, get_file_type(relative_path)))
+    return resolved_files
+
+# Directory structure
+def generate_directory_structure(resolved_files):
+    """
+    Generates a text representation of the directory structure for the given files.
+
+    Parameters:
+        resolved_files (list of tuple): (file path, relative path, file type) tuples from resolve_files.
+
+    Yields:
+        str: Directory structure lines, each produced once in first-seen order.
+    """
+    seen = set()
+    previous_parts = []
+    for _, relative_path, _ in resolved_files:
+        parts = relative_path.split(os.sep)
+        if not parts[0]:
+            parts[0] = os.sep  # Absolute paths start from the root directory
+        # Directories shared with the previous file were already emitted, so skip
+        # building and looking up their lines again
+        shared = 0
+        limit = min(len(parts), len(previous_parts))
+        while shared < limit and parts[shared] == previous_parts[shared]:
+            shared += 1
+        previous_parts = parts
+        for depth in range(shared, len(parts)):
+            line = '│   ' * depth + '├── ' + parts[depth]
+            if line not in seen:
+                seen.add(line)
+                yield line
 
 # File types
 def get_file_type(file):
@@ -342,456 +615,395 @@ def get_file_type(file):
     Determines the file type based on the file extension.
 
     Parameters:
-        file (Path): Path object of the file.
+        file (str): Path of the file.
 
     Returns:
         str: File type string for markdown syntax highlighting.
     """
-    # Extract the file extension
-    ext = Path(file).suffix.lower()
+    # Extract the file extension the way Path.suffix does, without building a Path
+    name = os.path.basename(file)
+    i = name.rfind('.')
+    ext = name[i:].lower() if 0 < i < len(name) - 1 else ''
     # Return the language if it's in the dictionary, else default to 'text'
     return FILE_TYPE_LANGUAGES.get(ext, 'text')
 
-def concatenate_files(files, output_file, skip_prompt=False, prompt_file=None):
+# Read-ahead hint
+def advise_sequential(f):
     """
-    Concatenates the content of multiple files, adds directory structure and file type annotations.
+    Tells the kernel the file will be read front to back so it can read ahead more
+    aggressively. Does nothing where posix_fadvise is unavailable or not supported.
 
     Parameters:
-        files (list of str): List of file paths to concatenate.
-        output_file (str): The name of the output file.
-        skip_prompt (bool): Whether to skip adding the additional prompt content at the beginning.
-        prompt_file (str): Path to a file containing the prompt content to include at the beginning.
+        f (file object): The open file.
     """
-    with open(output_file, 'w') as out_file:
-        if prompt_file:
-            try:
-                with open(prompt_file, 'r') as pf:
-                    prompt_content = pf.read()
-                out_file.write(prompt_content + '\n\n')
-            except Exception as e:
-                logging.error(f"Error reading prompt file {prompt_file}: {e}")
-        elif not skip_prompt:
-            # Write the LLM prompt
-            out_file.write("You are a super helpful coding assistant!\n\n")
-            out_file.write("Instructions:\n\nBelow you will find relevant files for a project I am working on. Please analyze these different files and confirm that you understand their purpose. I will provide multiple files, and I will let you know when the final file is provided. Do not offer updates or show me code at this time. If you do not understand something, please ask me questions for clarification.\n\n")
-            out_file.write("\n# When providing code help, please adhere to the following guidelines\n")
-            out_file.write("\n1. **Provide Code in Sections**: Do not provide whole files. Instead, provide specific sections, functions, or lines as needed.\n")
-            out_file.write("\n2. **Example for Line Changes**:\n")
-            out_file.write("    - Change this line:\n")
-            out_file.write("\n      ```python\n")
-            out_file.write("      Old line here\n")
-            out_file.write("      ```\n")
-            out_file.write("\n    - To this:\n")
-            out_file.write("\n      ```python\n")
-            out_file.write("      New line here\n")
-            out_file.write("      ```\n")
-            out_file.write("\n**Note**: When providing markdown code boxes, escape internal backticks by using triple backslashes before the backticks.\n")
-            out_file.write("\n## Style Guide for Writing Tools\n")
-            out_file.write("\n### 1. **Introduction**\n")
-            out_file.write("\n- Purpose of the Style Guide\n")
-            out_file.write("- Importance of Consistency\n")
-            out_file.write("\n## 2. **Script Header**\n")
-            out_file.write("\n- **Script Name Comment**: Include the name of the script at the top as a comment. This helps identify the log and output files.\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  # script_name.py\n")
-            out_file.write("  ```\n")
-            out_file.write("\n- **Summary Comment**: Include a brief summary of the script's purpose and functionality in comments at the top, after the filename and a line break.\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  # script_name.py\n")
-            out_file.write("\n  # This script combines multiple text files into a single text file.\n")
-            out_file.write("  # It prompts the user for the directory containing the text files,\n")
-            out_file.write("  # reads each file, and writes their contents into an output file.\n")
-            out_file.write("  ```\n")
-            out_file.write("\n## 3. **Imports**\n")
-            out_file.write("\n- **Grouping Imports**: Group imports in the following order: standard library imports, related third-party imports, local application/library-specific imports.\n")
-            out_file.write("- **Absolute Imports**: Use absolute imports when possible.\n")
-            out_file.write("\n## 4. **Configuration Management**\n")
-            out_file.write("\n- **Configuration Files**: Use configuration files for storing settings that might change frequently. This can help make your scripts more flexible and easier to manage.\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  import json\n")
-            out_file.write("\n  def load_config(config_file):\n")
-            out_file.write("      \"\"\"Load configuration settings from a file.\"\"\"\n")
-            out_file.write("      with open(config_file, 'r') as f:\n")
-            out_file.write("          config = json.load(f)\n")
-            out_file.write("      return config\n")
-            out_file.write("  ```\n")
-            out_file.write("\n## 5. **Function Definitions**\n")
-            out_file.write("\n- **Comment Titles**: Provide a concise title for every function as a comment above the function. Example:\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  # Data processing\n")
-            out_file.write("  def process_data(data):\n")
-            out_file.write("    \"\"\"\n")
-            out_file.write("    Process the given data.\n")
-            out_file.write("\n    Parameters:\n")
-            out_file.write("        data (list): A list of data items to be processed.\n")
-            out_file.write("\n    Returns:\n")
-            out_file.write("        list: The processed data.\n")
-            out_file.write("    \"\"\"\n")
-            out_file.write("    print(f\"Processing data: {data}\")\n")
-            out_file.write("    processed_data = [item * 2 for item in data]\n")
-            out_file.write("    print(\"Data processing complete.\")\n")
-            out_file.write("    return processed_data\n")
-            out_file.write("  ```\n")
-            out_file.write("\n- **Function Docstrings**: Provide a clear explanation of the function's purpose, parameters, and return values. Example:\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  # Example function\n")
-            out_file.write("  def example_function(param1, param2):\n")
-            out_file.write("      \"\"\"\n")
-            out_file.write("      Brief description of the function.\n")
-            out_file.write("\n      Parameters:\n")
-            out_file.write("          param1 (type): Description of param1.\n")
-            out_file.write("          param2 (type): Description of param2.\n")
-            out_file.write("      \n")
-            out_file.write("      Returns:\n")
-            out_file.write("          return_type: Description of the return value.\n")
-            out_file.write("      \"\"\"\n")
-            out_file.write("  ```\n")
-            out_file.write("\n- **Modular Code**: Break down tasks into small, reusable functions.\n")
-            out_file.write("\n## 6. **Code Formatting**\n")
-            out_file.write("\n- **Indentation**: Use 4 spaces for indentation.\n")
-            out_file.write("- **Line Length**: Limit all lines to a maximum of 79 characters.\n")
-            out_file.write("- **Blank Lines**: Use blank lines to separate top-level function and class definitions.\n")
-            out_file.write("- **String Quotes**: In general, use single quotes for short strings and double quotes for longer strings or when a string contains a single quote.\n")
-            out_file.write("- **Whitespace in Expressions and Statements**:\n")
-            out_file.write("  - Avoid extraneous whitespace in the following situations: immediately inside parentheses, brackets or braces; immediately before a comma, semicolon, or colon; immediately before the open parenthesis that starts the argument list of a function call.\n")
-            out_file.write("  - Use a single space around binary operators and after a comma.\n")
-            out_file.write("- **Naming Conventions**:\n")
-            out_file.write("  - Use `CamelCase` for class names.\n")
-            out_file.write("  - Use `lower_case_with_underscores` for functions and variable names.\n")
-            out_file.write("  - Use `UPPER_CASE_WITH_UNDERSCORES` for constants.\n")
-            out_file.write("\n## 7. **Commenting**\n")
-            out_file.write("\n- **Inline Comments**: Use comments to explain complex logic or important sections of code.\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  # This loop processes each file in the directory\n")
-            out_file.write("  for file in files:\n")
-            out_file.write("      ...\n")
-            out_file.write("  ```\n")
-            out_file.write("\n## 8. **Logging**\n")
-            out_file.write("\n- **Setup Logging**: Configure logging to output to both the console and a log file in the `./logs` directory. The log file should be named according to the script name.\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  def setup_logging(script_name):\n")
-            out_file.write("      \"\"\"Setup logging configuration.\"\"\"\n")
-            out_file.write("      log_dir = './logs'\n")
-            out_file.write("      os.makedirs(log_dir, exist_ok=True)\n")
-            out_file.write("      log_file = os.path.join(log_dir, f'{script_name}.log')\n")
-            out_file.write("\n      logging.basicConfig(level=logging.DEBUG,\n")
-            out_file.write("                          format='%(asctime)s - %(levelname)s - %(message)s',\n")
-            out_file.write("                          handlers=[\n")
-            out_file.write("                              logging.FileHandler(log_file),\n")
-            out_file.write("                              logging.StreamHandler()\n")
-            out_file.write("                          ])\n")
-            out_file.write("  ```\n")
-            out_file.write("\n- **Logging Levels**: Use appropriate logging levels (`DEBUG`, `INFO`, `ERROR`) to provide detailed and useful log messages.\n")
-            out_file.write("\n    ```python\n")
-            out_file.write("    logging.debug(f\"Processing file: {file_path}\")\n")
-            out_file.write("    logging.info(\"Operation completed successfully.\")\n")
-            out_file.write("    logging.error(f\"Error processing file: {e}\")\n")
-            out_file.write("    ```\n")
-            out_file.write("\n## 9. **Error Handling**\n")
-            out_file.write("\n- **Try-Except Blocks**: Use try-except blocks to handle potential errors gracefully.\n")
-            out_file.write("\n    ```python\n")
-            out_file.write("    try:\n")
-            out_file.write("        # code that may raise an exception\n")
-            out_file.write("    except Exception as e:\n")
-            out_file.write("        logging.error(f\"An error occurred: {e}\")\n")
-            out_file.write("    ```\n")
-            out_file.write("\n- **Using Whole New Functions**: Implement whole new functions within try-except blocks to keep the code modular and maintainable.\n")
-            out_file.write("\n## 10. **Testing and Debugging**\n")
-            out_file.write("\n- **Unit Tests**: Write unit tests for your functions to ensure they work correctly.\n")
-            out_file.write("\n  ```python\n")
-            out_file.write("  import unittest\n")
-            out_file.write("\n  class TestExampleFunction(unittest.TestCase):\n")
-            out_file.write("      def test_example_function(self):\n")
-            out_file.write("          self.assertEqual(example_function(param1, param2), expected_result)\n")
-            out_file.write("\n  if __name__ == '__main__':\n")
-            out_file.write("      unittest.main()\n")
-            out_file.write("  ```\n")
-            out_file.write("\n## 12. **PEP 8 Compliance**\n")
-            out_file.write("\n- Summary of Key Points\n")
-            out_file.write("  - **Indentation**: Use 4 spaces per indentation level.\n")
-            out_file.write("  - **Line Length**: Limit all lines to a maximum of 79 characters.\n")
-            out_file.write("  - **Blank Lines**: Use blank lines to separate top-level function and class definitions.\n")
-            out_file.write("  - **Imports**:\n")
-            out_file.write("    - Imports should usually be on separate lines.\n")
-            out_file.write("    - Group imports in the following order: standard library imports, related third-party imports, local application/library-specific imports.\n")
-            out_file.write("    - Use absolute imports when possible.\n")
-            out_file.write("  - **String Quotes**: In general, use single quotes for short strings and double quotes for longer strings or when a string contains a single quote.\n")
-            out_file.write("  - **Whitespace in Expressions and Statements**:\n")
-            out_file.write("    - Avoid extraneous whitespace in the following situations: immediately inside parentheses, brackets or braces; immediately before a comma, semicolon, or colon; immediately before the open parenthesis that starts the argument list of a function call.\n")
-            out_file.write("    - Use a single space around binary operators and after a comma.\n")
-            out_file.write("  - **Naming Conventions**:\n")
-            out_file.write("    - Use `CamelCase` for class names.\n")
-            out_file.write("    - Use `lower_case_with_underscores` for functions and variable names.\n")
-            out_file.write("    - Use `UPPER_CASE_WITH_UNDERSCORES` for constants.\n")
-            out_file.write("\nRemember to follow the guidelines provided in the style guide to maintain consistency and readability in the code.\n")
-            out_file.write("\nINSTRUCTION I am senging multiple parts, please confirm receipt of the files and let me know when you are ready for the next part.  Do not do anything else until you have all the parts.\n\n")
-                
-        # Write the directory structure
-        out_file.write("\nHere is the directory structure:\n")
-        out_file.write('\n├── ./\n')
-        directory_structure = generate_directory_structure(files)
-        for line in directory_structure:
-            out_file.write(line + '\n')
-        out_file.write('\n')
-        
-        # Concatenate the contents of each file
-        out_file.write("\nHere are the files:\n\n")
-        for file in files:
-            path = Path(file).resolve()
-            try:
-                relative_path = path.relative_to(Path('.').resolve())
-            except ValueError:
-                relative_path = path  # If the path is not relative, use the absolute path
-            file_type = get_file_type(path)
-            
-            out_file.write(f'./{relative_path}\n\n')
-            out_file.write(f'```{file_type}\n')
-            
-            try:
-                with open(file, 'r') as f:
-                    out_file.write(f.read())
-            except Exception as e:
-                logging.error(f"Error reading file {file}: {e}")
-            
-            out_file.write('\n```\n\n')
-
-def split_into_chunks_with_messages(file_path, chunk_size=CHUNK_SIZE):
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Not supported for this kind of file; the hint is only an optimization
+
+# Read file
+def read_file_bytes(file):
     """
-    Splits a file into smaller chunks with whole lines and adds end-of-part messages.
+    Reads the contents of a file as bytes.
 
     Parameters:
-        file_path (str): The path to the file to split.
-        chunk_size (int): The size of each chunk in characters.
+        file (str): Path of the file to read.
 
     Returns:
-        list of str: List of file paths of the chunks.
+        bytes: The file contents, or empty bytes if the file could not be read.
     """
-    with open(file_path, 'r') as f:
-        content = f.read()
+    try:
+        with open(file, 'rb') as f:
+            advise_sequential(f)
+            return f.read()
+    except Exception as e:
+        logging.error(f"Error reading file {file}: {e}")
+        return b''
 
-    lines = content.splitlines(keepends=True)
-    chunks = []
-    current_chunk = ''
-    part_number = 1
-
-    for line in lines:
-        if len(current_chunk) + len(line) > chunk_size:
-            # Add end-of-part message
-            if part_number == len(chunks) + 1:  # For all parts except the last one
-                current_chunk += f"\nEnd of part {part_number}. Please confirm receipt.\n"
-                chunks.append(current_chunk)
-                current_chunk = ''
-                part_number += 1
-        current_chunk += line
-
-    if current_chunk:  # Add the last chunk
-        current_chunk += f"\nEnd of part {part_number}. Please confirm receipt.\n"
-        chunks.append(current_chunk)
+# Read files
+def read_files(files):
+    """
+    Reads the given files in order, overlapping the reads on a thread pool when there
+    are enough of them for the latency of slow or network file systems to add up.
 
-    chunk_files = []
-    base_name = Path(file_path).stem
-    ext = Path(file_path).suffix
+    Only a bounded number of reads are in flight at once, so files are not all held
+    in memory ahead of the caller.
 
-    for i, chunk in enumerate(chunks):
-        chunk_file_path = f"{base_name}_chunk_{i + 1}{ext}"
-        with open(chunk_file_path, 'w') as chunk_file:
-            chunk_file.write(chunk)
-        chunk_files.append(chunk_file_path)
+    Parameters:
+        files (list of str): Paths of the files to read.
 
-    return chunk_files
+    Yields:
+        bytes: The contents of each file, in the order given.
+    """
+    if len(files) < PARALLEL_READ_MIN_FILES:
+        for file in files:
+            yield read_file_bytes(file)
+        return
 
+    workers = min(MAX_READ_WORKERS, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for file in files:
+            pending.append(pool.submit(read_file_bytes, file))
+            if len(pending) > workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
-def split_into_chunks_with_messages(file_path, chunk_size=CHUNK_SIZE):
+def concatenate_files(resolved_files, output_file, skip_prompt=False, prompt_file=None):
     """
-    Splits a file into smaller chunks with whole lines and adds end-of-part messages.
+    Concatenates the content of multiple files, adds directory structure and file type annotations.
 
     Parameters:
-        file_path (str): The path to the file to split.
-        chunk_size (int): The size of each chunk in characters.
+        resolved_files (list of tuple): (file path, relative path, file type) tuples from resolve_files.
+        output_file (str): The name of the output file.
+        skip_prompt (bool): Whether to skip adding the additional prompt content at the beginning.
+        prompt_file (str): Path to a file containing the prompt content to include at the beginning.
 
     Returns:
-        list of str: List of file paths of the chunks.
+        bytes: The concatenated output, as written to the output file.
     """
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    lines = content.splitlines(keepends=True)
-    chunks = []
-    current_chunk = ''
-    part_number = 1
-
-    for line in lines:
-        if len(current_chunk) + len(line) > chunk_size:
-            # Add end-of-part message
-            if part_number == len(chunks) + 1:  # For all parts except the last one
-                current_chunk += f"\nEnd of part {part_number}. Please confirm receipt and let me know when you are ready for the next part.\n"
-            chunks.append(current_chunk)
-            current_chunk = ''
-            part_number += 1
-        current_chunk += line
-
-    # Add the last chunk
-    if current_chunk:
-        current_chunk += f"\nEnd of part {part_number}. This is the final part. Please confirm receipt of all parts and proceed with the analysis only after receiving this message.\n"
-        chunks.append(current_chunk)
-
-    # Write chunks to files
-    chunk_files = []
-    base_name = Path(file_path).stem
-    ext = Path(file_path).suffix
-
-    for i, chunk in enumerate(chunks):
-        chunk_file_path = f"{base_name}_chunk_{i + 1}{ext}"
-        with open(chunk_file_path, 'w') as chunk_file:
-            chunk_file.write(chunk)
-        chunk_files.append(chunk_file_path)
-
-    return chunk_files
-
-from pathlib import Path
-
-from pathlib import Path
-
-def split_into_chunks_with_messages(file_path, chunk_size):
+    # Build the output in memory as bytes and write it in one go; file contents
+    # are passed through without a decode/encode round-trip
+    buf = io.BytesIO()
+    if prompt_file:
+        try:
+            with open(prompt_file, 'rb') as pf:
+                prompt_content = pf.read()
+            buf.write(prompt_content + b'\n\n')
+        except Exception as e:
+            logging.error(f"Error reading prompt file {prompt_file}: {e}")
+    elif not skip_prompt:
+        # Write the LLM prompt
+        buf.write(PROMPT_BYTES)
+
+    # Write the directory structure
+    buf.write(b"\nHere is the directory structure:\n")
+    buf.write('\n├── ./\n'.encode('utf-8'))
+    for line in generate_directory_structure(resolved_files):
+        buf.write(f'{line}\n'.encode('utf-8'))
+    buf.write(b'\n')
+
+    # Concatenate the contents of each file
+    buf.write(b"\nHere are the files:\n\n")
+    contents = read_files([file for file, _, _ in resolved_files])
+    for (_, relative_path, file_type), content in zip(resolved_files, contents):
+        buf.write(f'./{relative_path}\n\n```{file_type}\n'.encode('utf-8'))
+        buf.write(content)
+        buf.write(b'\n```\n\n')
+
+    output = buf.getvalue()
+    with open(output_file, 'wb') as out_file:
+        out_file.write(output)
+    return output
+
+# Split content into chunks
+def split_text_into_chunks_with_messages(content, chunk_size=CHUNK_SIZE):
     """
-    Splits a file into smaller chunks with whole lines and handles code boxes properly,
-    adding end-of-part messages and continuation notices.
+    Splits the concatenated output into smaller chunks with whole lines and handles
+    code boxes properly, adding end-of-part messages and continuation notices.
+
+    Chunk boundaries are found as byte offsets and each chunk body is a single
+    slice of the content, so the output is never split into per-line strings.
 
     Parameters:
-        file_path (str): The path to the file to split.
-        chunk_size (int): The size of each chunk in characters.
+        content (bytes): The concatenated output to split.
+        chunk_size (int): The size of each chunk in bytes.
 
     Returns:
-        list of str: List of file paths of the chunks.
+        list of bytes: The chunks, including their part messages.
     """
-    def count_chunks(file_path, chunk_size):
-        with open(file_path, 'r') as f:
-            content = f.read()
-
-        lines = content.splitlines(keepends=True)
-        current_chunk = ''
-        chunk_count = 0
-        in_code_box = False
-
-        for line in lines:
-            if line.startswith('```') and not in_code_box:
-                in_code_box = True
-            elif line.startswith('```') and in_code_box:
-                in_code_box = False
-
-            if len(current_chunk) + len(line) > chunk_size:
-                chunk_count += 1
-                current_chunk = ''  # Reset for new chunk
-
-            current_chunk += line
-
-        if len(current_chunk) > 0:
-            chunk_count += 1  # For the last chunk
-
-        return chunk_count
-
-    total_chunks = count_chunks(file_path, chunk_size)
-
-    def add_end_of_part_message(chunk, part_number, total_chunks, current_file_name, in_code_box):
-        if in_code_box:
-            chunk += '```\n'
-        chunk += f"\n{current_file_name} continued in next file\n"
-        chunk += f"\nEnd of part {part_number} of {total_chunks}. Please confirm receipt and let me know when you are ready for the next part.\n"
-        return chunk
-
-    def add_start_of_part_message(current_chunk, part_number, current_file_name, in_code_box):
-        """
-        Adds a start-of-part message to the current chunk with appropriate code box formatting.
-
-        Parameters:
-            current_chunk (str): The current chunk of text.
-            part_number (int): The part number for the chunk.
-            current_file_name (str): The name of the current file.
-            in_code_box (bool): Whether the chunk is within a code box.
-
-        Returns:
-            str: The updated chunk with the start-of-part message.
-        """
-        current_chunk += f"\nBeginning of part {part_number}\n\n"
-        current_chunk += f"{current_file_name} (continued)\n\n"
+    def start_of_part_message(part_number, current_file_name, in_code_box):
+        """Build the notice that opens a continued part, reopening the code box if needed."""
+        message = f"\nBeginning of part {part_number}\n\n"
+        message += f"{current_file_name} (continued)\n\n"
         if in_code_box:
             # Use the get_file_type function to determine the code box language
-            file_type = get_file_type(current_file_name)
-            current_chunk += f'```{file_type}\n'
-        return current_chunk
-
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    lines = content.splitlines(keepends=True)
-    chunks = []
-    current_chunk = ''
-    part_number = 1
+            message += f'```{get_file_type(current_file_name)}\n'
+        return message.encode('utf-8')
+
+    def end_of_part_message(part_number, total_chunks, current_file_name, in_code_box):
+        """Build the notice that closes a part, closing the code box if needed."""
+        message = '```\n' if in_code_box else ''
+        message += f"\n{current_file_name} continued in next file\n"
+        message += f"\nEnd of part {part_number} of {total_chunks}. Please confirm receipt and let me know when you are ready for the next part.\n"
+        return message.encode('utf-8')
+
+    def final_part_message(part_number, total_chunks, in_code_box):
+        """Build the notice that closes the last part."""
+        message = '```\n' if in_code_box else ''
+        message += f"\nEnd of part {part_number} of {total_chunks}. This is the final part. Please confirm receipt of all parts and proceed with the analysis only after receiving this message.\n"
+        return message.encode('utf-8')
+
+    size = len(content)
+    if size == 0:
+        return []
+
+    def next_marker(marker, after):
+        """Return the offset of the next line after `after` that starts with marker, or size."""
+        index = content.find(b'\n' + marker, after)
+        return size if index == -1 else index + 1
+
+    # Only code fences and file names change the state, so jump straight
+    # between them instead of examining every line
+    next_fence = 0 if content[:3] == b'```' else next_marker(b'```', 0)
+    next_file = 0 if content[:2] == b'./' else next_marker(b'./', 0)
+
+    # Find the chunk boundaries as byte offsets, recording the file name
+    # and code box state at each one for the part messages
+    cuts = [(0, '', False)]
     in_code_box = False
-    current_file_name = ""
+    current_file_name = ''
+    start = 0
+    header_len = 0
+    while True:
+        # Cut after the last whole line that fits, but always keep at least one line
+        limit = start + chunk_size - header_len
+        if size <= limit:
+            cut = size
+        else:
+            newline = content.rfind(b'\n', start, limit) if limit > start else -1
+            if newline == -1:
+                newline = content.find(b'\n', start)
+            cut = size if newline == -1 else newline + 1
+
+        # Apply the markers that start before the cut
+        while min(next_fence, next_file) < cut:
+            if next_fence < next_file:
+                in_code_box = not in_code_box
+                next_fence = next_marker(b'```', next_fence)
+            else:
+                # Track the current file name for continuation messages
+                if not in_code_box:
+                    line_end = content.find(b'\n', next_file)
+                    line_end = size if line_end == -1 else line_end
+                    current_file_name = content[next_file:line_end].decode('utf-8', 'replace').strip()
+                next_file = next_marker(b'./', next_file)
+
+        cuts.append((cut, current_file_name, in_code_box))
+        if cut == size:
+            break
+        start = cut
+        header_len = len(start_of_part_message(len(cuts), current_file_name, in_code_box))
+
+    # Build the chunks; the chunk count is known up front
+    total_chunks = len(cuts) - 1
+    chunks = [None] * total_chunks
+
+    # Slice through a memoryview so each chunk body is copied only once,
+    # straight from the content into the joined chunk
+    with memoryview(content) as view:
+        for i in range(total_chunks):
+            lo, lo_file_name, lo_in_code_box = cuts[i]
+            hi, hi_file_name, hi_in_code_box = cuts[i + 1]
+            part_number = i + 1
+
+            header = start_of_part_message(part_number, lo_file_name, lo_in_code_box) if i else b''
+            if part_number == total_chunks:
+                footer = final_part_message(part_number, total_chunks, hi_in_code_box)
+            else:
+                footer = end_of_part_message(part_number, total_chunks, hi_file_name, hi_in_code_box)
+            chunks[i] = b''.join((header, view[lo:hi], footer))
 
-    for line in lines:
-        if line.startswith('```') and not in_code_box:
-            in_code_box = True
-        elif line.startswith('```') and in_code_box:
-            in_code_box = False
+    return chunks
 
-        if len(current_chunk) + len(line) > chunk_size:
-            current_chunk = add_end_of_part_message(current_chunk, part_number, total_chunks, current_file_name, in_code_box)
-            chunks.append(current_chunk)
-            part_number += 1
-            current_chunk = add_start_of_part_message('', part_number, current_file_name, in_code_box)
+# Write chunk file
+def write_chunk_file(chunk_file_path, chunk):
+    """
+    Writes a whole chunk to a file using raw file descriptor calls.
 
-        current_chunk += line
+    Each chunk is already a single buffer, so going through os.open skips the
+    buffered file object and the extra stat and seek calls it makes per file.
 
-        # Track the current file name for continuation messages
-        if line.startswith('./') and not in_code_box:
-            current_file_name = line.strip()
+    Parameters:
+        chunk_file_path (str): The path of the chunk file to write.
+        chunk (bytes): The chunk content.
+    """
+    fd = os.open(chunk_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# Write chunk files
+def write_chunk_files(output_file, chunks):
+    """
+    Writes each chunk to its own file named after the output file.
 
-    if current_chunk:
-        if in_code_box:
-            current_chunk += '```\n'
-        current_chunk += f"\nEnd of part {part_number} of {total_chunks}. This is the final part. Please confirm receipt of all parts and proceed with the analysis only after receiving this message.\n"
-        chunks.append(current_chunk)
+    Parameters:
+        output_file (str): The name of the output file the chunks were split from.
+        chunks (list of bytes): The chunks to write.
 
-    # Write chunks to files
+    Returns:
+        list of str: List of file paths of the chunks.
+    """
+    base_name = Path(output_file).stem
+    ext = Path(output_file).suffix
     chunk_files = []
-    base_name = Path(file_path).stem
-    ext = Path(file_path).suffix
-
     for i, chunk in enumerate(chunks):
         chunk_file_path = f"{base_name}_chunk_{i + 1}{ext}"
-        with open(chunk_file_path, 'w') as chunk_file:
-            chunk_file.write(chunk)
+        write_chunk_file(chunk_file_path, chunk)
         chunk_files.append(chunk_file_path)
-
     return chunk_files
 
-
-
 # Copy contents to clipboard
 def copy_to_clipboard(content):
     """
     Copies the given content to the clipboard.
 
     Parameters:
-        content (str): The content to copy to the clipboard.
+        content (bytes): The content to copy to the clipboard.
     """
-    system = platform.system()
+    command = CLIPBOARD_COMMANDS.get(SYSTEM)
     try:
-        if system == 'Linux':
-            subprocess.run(['xclip', '-selection', 'clipboard'], input=content.encode('utf-8'))
-        elif system == 'Darwin':  # macOS
-            subprocess.run(['pbcopy'], input=content.encode('utf-8'))
-        elif system == 'Windows':
-            subprocess.run(['clip'], input=content.encode('utf-8'))
+        if pyperclip and SYSTEM == 'Windows':
+            # pyperclip uses the Win32 clipboard API directly instead of spawning clip.exe
+            pyperclip.copy(content.decode('utf-8', 'replace'))
+        elif command:
+            subprocess.run(command, input=content)
         else:
-            print(f"Clipboard copy not supported on {system}.")
-            
+            print(f"Clipboard copy not supported on {SYSTEM}.")
+
         print("Contents copied to clipboard.")
     except Exception as e:
         logging.error(f"Error copying contents to clipboard: {e}")
 
+# Recursive file search
+def find_files_recursive(patterns):
+    """
+    Finds files matching any of the patterns in the current directory and all of its subdirectories.
+
+    For each pattern this matches what glob.glob(f'**/{pattern}', recursive=True) finds, but
+    the tree is walked once for all patterns with os.scandir, so each entry's cached type is
+    reused instead of stat'ing it again. Every pattern is compiled to regexes once, and file
+    names are checked against a single combined regex before any pattern is tried in full.
+    As with glob, hidden files and directories are skipped unless the pattern names them.
+
+    Parameters:
+        patterns (list of str): The file patterns to match, optionally with leading directories.
+
+    Returns:
+        list of str: Relative paths of the matching files, grouped by the first pattern
+        each one matches, in pattern order.
+    """
+    # Compare names the way fnmatch.fnmatch does, case-insensitively where the OS is.
+    # Each '**' component becomes None, and every pattern is searched for under '**' like glob
+    compiled = []
+    last_names = []
+    for pattern in patterns:
+        components = [None]
+        last_name = '.*'
+        for c in os.path.normpath(pattern).split(os.sep):
+            if c == '**':
+                if components[-1] is not None:
+                    components.append(None)
+                last_name = '.*'
+            elif c:
+                last_name = fnmatch.translate(os.path.normcase(c))
+                components.append((c.startswith('.'), re.compile(last_name).match))
+        compiled.append(components)
+        last_names.append(last_name)
+    if not compiled:
+        return []
+
+    last_name_match = re.compile('|'.join(f'(?:{name})' for name in last_names)).match
+    # Hidden directories are only entered when a pattern names them explicitly
+    hidden_directory_matches = [component[1] for components in compiled
+                                for component in components[:-1] if component and component[0]]
+
+    def path_matches(names, components):
+        """Check the path names against the pattern components, where None stands for '**'."""
+        if not components:
+            return not names
+        if components[0] is None:
+            if len(components) == 1:
+                # A trailing '**' matches everything below, as long as none of it is hidden
+                return bool(names) and not any(name.startswith('.') for name in names)
+            # Otherwise '**' matches zero or more directories that aren't hidden
+            for depth in range(len(names)):
+                if path_matches(names[depth:], components[1:]):
+                    return True
+                if names[depth].startswith('.'):
+                    return False
+            return False
+        if not names:
+            return False
+        hidden, match = components[0]
+        if names[0].startswith('.') and not hidden:
+            return False
+        return bool(match(os.path.normcase(names[0]))) and path_matches(names[1:], components[1:])
+
+    found = [[] for _ in compiled]
+    stack = ['']
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory or '.')
+        except OSError:
+            continue
+
+        subdirectories = []
+        with entries:
+            for entry in entries:
+                path = os.path.join(directory, entry.name) if directory else entry.name
+                if entry.is_dir():
+                    if not entry.name.startswith('.') or any(
+                            match(os.path.normcase(entry.name)) for match in hidden_directory_matches):
+                        subdirectories.append(path)
+                elif last_name_match(os.path.normcase(entry.name)) and entry.is_file():
+                    names = path.split(os.sep)
+                    for i, components in enumerate(compiled):
+                        if path_matches(names, components):
+                            found[i].append(path)
+                            break
+
+        # Visit subdirectories depth-first in listing order, like glob
+        stack.extend(reversed(subdirectories))
+    return [path for paths in found for path in paths]
+
 # Add recursive option to glob
 def collect_files(patterns, exclude_patterns=None, recursive=False):
     """
@@ -809,25 +1021,29 @@ def collect_files(patterns, exclude_patterns=None, recursive=False):
     if exclude_patterns is None:
         exclude_patterns = []
 
-    all_files = []
-    for pattern in patterns:
-        if recursive:
-            all_files.extend(glob.glob(f'**/{pattern}', recursive=True))
-        else:
-            all_files.extend(glob.glob(pattern))
-
-    excluded_files = set()
-    for pattern in exclude_patterns:
-        if recursive:
-            excluded_files.update(glob.glob(f'**/{pattern}', recursive=True))
-        else:
-            excluded_files.update(glob.glob(pattern))
+    if recursive:
+        # One walk of the tree covers all of the patterns
+        all_files = find_files_recursive(patterns)
+        excluded = find_files_recursive(exclude_patterns)
+    else:
+        all_files = []
+        for pattern in patterns:
+            all_files.extend(glob.iglob(pattern))
+        excluded = []
+        for pattern in exclude_patterns:
+            excluded.extend(glob.iglob(pattern))
+    # Resolved like the matched files below, so the two can be compared
+    excluded_files = {Path(f).resolve() for f in excluded}
 
     # Exclude directories and their contents
     excluded_dirs = {Path(p).resolve() for p in exclude_patterns if Path(p).is_dir()}
     result_files = []
+    seen = set()  # Overlapping patterns can match the same file more than once
     for file in all_files:
         file_path = Path(file).resolve()
+        if file_path in seen:
+            continue
+        seen.add(file_path)
         if file_path not in excluded_files and not any(file_path.is_relative_to(d) for d in excluded_dirs):
             result_files.append(file)
     
@@ -849,9 +1065,11 @@ def main():
     parser.add_argument('-sp', '--skip-prompt', action='store_true', help='Skip adding the LLM prompt content at the beginning')
     parser.add_argument('-pf', '--prompt-file', type=str, help='Path to a file containing the prompt content to include at the beginning')
     parser.add_argument('-c', '--copy', action='store_true', help='Copy the output to the clipboard')
+    parser.add_argument('-ca', '--copy-all', action='store_true', help='Copy the whole output to the clipboard at once instead of chunk by chunk')
     parser.add_argument('-r', '--recursive', action='store_true', help='Recursively search directories for files matching the patterns')
     parser.add_argument('-ex', '--exclude', nargs='+', help='Patterns of files to exclude')
     parser.add_argument('-cs', '--chunk-size', type=int, default=CHUNK_SIZE, help=f'Chunk size for splitting the output file (default: {CHUNK_SIZE})')
+    parser.add_argument('-wc', '--write-chunks', action='store_true', help='Also write each chunk to its own file')
     parser.add_argument('-d', '--delete-chunks', action='store_true', help='Delete chunk files after copying to clipboard')
 
     args = parser.parse_args()
@@ -864,26 +1082,37 @@ def main():
         logging.error("No files found matching the given patterns.")
         return
     
-    concatenate_files(files, args.output, skip_prompt=args.skip_prompt, prompt_file=args.prompt_file)
+    # Resolve every file once for both the directory structure and the contents
+    resolved_files = resolve_files(files, os.getcwd())
+    output = concatenate_files(resolved_files, args.output, skip_prompt=args.skip_prompt, prompt_file=args.prompt_file)
     logging.info("File concatenation completed successfully.")
     
-    # Split the output file into chunks with messages
-    chunk_files = split_into_chunks_with_messages(args.output, chunk_size=args.chunk_size)
-    logging.info(f"Output file split into {len(chunk_files)} chunks.")
+    # Copying the whole output at once only needs chunks if they are written to files
+    chunks = []
+    if not args.copy_all or args.write_chunks:
+        # Split the output into chunks with messages straight from memory
+        chunks = split_text_into_chunks_with_messages(output, chunk_size=args.chunk_size)
+        logging.info(f"Output split into {len(chunks)} chunks.")
+
+    chunk_files = []
+    if args.write_chunks:
+        chunk_files = write_chunk_files(args.output, chunks)
+        logging.info(f"Chunks written to {len(chunk_files)} files.")
 
+    if args.copy_all:
+        # One clipboard call for the whole output, no prompts between chunks
+        copy_to_clipboard(output)
     # Ask the user if they want to copy the contents to the clipboard
-    if args.copy or input("Do you want to copy the contents to the clipboard? ([y]es/no): ").strip().lower() in ['yes', 'y', '']:
-        for i, chunk_file in enumerate(chunk_files):
-            with open(chunk_file, 'r') as f:
-                chunk_content = f.read()
-            copy_to_clipboard(chunk_content)
-            print(f"Chunk {i + 1} of {len(chunk_files)} copied to clipboard.")
-            if i < len(chunk_files) - 1:
-                input(f"Press Enter to copy chunk {i + 2} of {len(chunk_files)}...")
+    elif args.copy or input("Do you want to copy the contents to the clipboard? ([y]es/no): ").strip().lower() in ['yes', 'y', '']:
+        for i, chunk in enumerate(chunks):
+            copy_to_clipboard(chunk)
+            print(f"Chunk {i + 1} of {len(chunks)} copied to clipboard.")
+            if i < len(chunks) - 1:
+                input(f"Press Enter to copy chunk {i + 2} of {len(chunks)}...")
             else:
                 print("All chunks have been copied.")
 
-        if args.delete_chunks or input("Do you want to delete all the chunk files? ([y]es/no): ").strip().lower() in ['yes', 'y', '']:
+        if chunk_files and (args.delete_chunks or input("Do you want to delete all the chunk files? ([y]es/no): ").strip().lower() in ['yes', 'y', '']):
             for chunk_file in chunk_files:
                 try:
                     os.remove(chunk_file)
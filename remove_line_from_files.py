@@ -7,21 +7,40 @@
 
 import os
 import argparse
+import atexit
 import logging
+import mmap
+import queue
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Threads for processing files concurrently
+# Prompts are only coloured on a terminal, so piped output stays free of escape codes
+PROMPT_COLOR = '\033[32m' if sys.stdout.isatty() else ''
+PROMPT_RESET = '\033[0m' if sys.stdout.isatty() else ''
 
 def setup_logging(script_name):
-    """Setup logging configuration."""
+    """
+    Setup logging configuration.
+
+    Records are formatted where they are logged and put on a queue, and a background
+    listener writes them to the file and console, so worker threads never wait on log I/O.
+    """
     log_dir = './logs'
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, f'{script_name}.log')
 
+    log_queue = queue.Queue()
+    listener = QueueListener(log_queue, logging.FileHandler(log_file), logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)  # Flush the remaining records on exit
+
     logging.basicConfig(level=logging.DEBUG,
                         format='%(asctime)s - %(levelname)s - %(message)s',
-                        handlers=[
-                            logging.FileHandler(log_file),
-                            logging.StreamHandler()
-                        ])
+                        handlers=[QueueHandler(log_queue)])
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -29,32 +48,105 @@ def clear_screen():
 
 def get_user_input(prompt, default_value):
     """Prompt the user for input, returning a default value if none provided."""
-    user_input = input(f"\033[32m{prompt} (default: {default_value}): \033[0m").strip()
+    user_input = input(f"{PROMPT_COLOR}{prompt} (default: {default_value}): {PROMPT_RESET}").strip()
     return user_input or default_value
 
+def advise_sequential(file):
+    """
+    Tell the kernel the file will be read front to back so it can read ahead more aggressively.
+    Does nothing where posix_fadvise is unavailable or not supported for the file.
+
+    Parameters:
+        file (file object): The open file.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def file_contains(file_path, target):
+    """
+    Check whether the file contains the target bytes anywhere, scanning it through mmap.
+
+    Parameters:
+        file_path (str): Path to the file.
+        target (bytes): The bytes to search for.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return False  # Empty files can't be mapped and have nothing to remove
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(target) != -1
+
 def remove_line_from_file(file_path, line_to_remove):
     """
-    Remove the specified line from the file and log each removal.
+    Remove the specified line from the file and log how many lines were removed.
 
     Parameters:
         file_path (str): Path to the file.
         line_to_remove (str): The exact line to remove from the file.
     """
+    logging.debug(f"Processing file: {file_path}")
+    # Work on raw bytes; only lines that contain the target at all are decoded and stripped
+    target = line_to_remove.encode('utf-8')
+    temp_path = None
     try:
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-
-        with open(file_path, 'w') as file:
-            for line in lines:
-                if line.strip() != line_to_remove:
-                    file.write(line)
+        # Files without the target anywhere are left as they are instead of being rewritten
+        if not file_contains(file_path, target):
+            logging.info(f"Completed processing file: {file_path}")
+            return
+
+        # Stream the kept lines into a temporary file next to the original, then swap it in.
+        # Symlinks are resolved first so the link's target is edited rather than the link replaced
+        real_path = os.path.realpath(file_path)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(real_path))
+        removed = 0
+        with os.fdopen(fd, 'wb') as temp_file, open(file_path, 'rb') as file:
+            advise_sequential(file)
+            for line in file:
+                if target not in line or line.decode('utf-8', errors='replace').strip() != line_to_remove:
+                    temp_file.write(line)
                 else:
-                    logging.info(f"Removed line from file {file_path}: {line.strip()}")
-
+                    removed += 1
+
+        if removed:
+            shutil.copymode(real_path, temp_path)
+            os.replace(temp_path, real_path)
+            # One record per file rather than one per removed line
+            logging.info(f"Removed {removed} line(s) from file {file_path}: {line_to_remove}")
+        else:
+            # The target only appeared inside other lines, so keep the original file
+            os.remove(temp_path)
         logging.info(f"Completed processing file: {file_path}")
 
     except Exception as e:
         logging.error(f"Error processing file {file_path}: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def find_files(directory, extension):
+    """
+    Walk the directory tree with os.scandir and yield the files with the specified extension.
+
+    Parameters:
+        directory (str): Directory to search for files.
+        extension (str): File extension to filter by.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.name.endswith(extension):
+                    yield entry.path
 
 def process_files(directory, extension, line_to_remove):
     """
@@ -66,12 +158,14 @@ def process_files(directory, extension, line_to_remove):
         extension (str): File extension to filter by.
         line_to_remove (str): The exact line to remove from the files.
     """
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(extension):
-                file_path = os.path.join(root, file)
-                logging.debug(f"Processing file: {file_path}")
-                remove_line_from_file(file_path, line_to_remove)
+    # Collect the files first so the work can be spread evenly over the threads
+    file_paths = list(find_files(directory, extension))
+
+    # Each file is independent and the work is I/O bound, so process them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(remove_line_from_file, file_path, line_to_remove) for file_path in file_paths]
+        for future in futures:
+            future.result()  # Surface unexpected errors instead of dropping them
 
 def main():
     parser = argparse.ArgumentParser(description="Remove an exact line from all files of a specified type in a directory.")
@@ -7,21 +7,48 @@
 
 import os
 import argparse
+import atexit
 import logging
+import mmap
+import queue
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Default number of files processed concurrently
+LOG_BUFFER_RECORDS = 1024  # Log records buffered before they are written to the log file
+# Prompts are only coloured on a terminal, so piped output stays free of escape codes
+PROMPT_COLOR = '\033[32m' if sys.stdout.isatty() else ''
+PROMPT_RESET = '\033[0m' if sys.stdout.isatty() else ''
 
 def setup_logging(script_name):
-    """Setup logging configuration."""
+    """
+    Setup logging configuration.
+
+    Records are formatted where they are logged and put on a queue, and a background
+    listener writes them to the file and console, so worker threads never wait on log I/O.
+    File records are buffered and written in batches; the console only shows INFO and up.
+    """
     log_dir = './logs'
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, f'{script_name}.log')
 
+    # Logging flushes and closes the buffer at exit, after the listener has been drained
+    file_handler = MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.ERROR,
+                                 target=logging.FileHandler(log_file))
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+
+    log_queue = queue.Queue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush the remaining records on exit
+
     logging.basicConfig(level=logging.DEBUG,
                         format='%(asctime)s - %(levelname)s - %(message)s',
-                        handlers=[
-                            logging.FileHandler(log_file),
-                            logging.StreamHandler()
-                        ])
+                        handlers=[QueueHandler(log_queue)])
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -29,36 +56,140 @@ def clear_screen():
 
 def get_user_input(prompt, default_value):
     """Prompt the user for input, returning a default value if none provided."""
-    user_input = input(f"\033[32m{prompt} (default: {default_value}): \033[0m").strip()
+    user_input = input(f"{PROMPT_COLOR}{prompt} (default: {default_value}): {PROMPT_RESET}").strip()
     return user_input or default_value
 
+def write_all(fd, data):
+    """
+    Write all of the data to the file descriptor, retrying after partial writes.
+
+    Parameters:
+        fd (int): File descriptor to write to.
+        data (bytes-like): The data to write.
+    """
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+
+def copy_span(source_fd, target_fd, view, start, end):
+    """
+    Copy bytes start to end of the source file to the target file.
+
+    os.sendfile moves them between the files inside the kernel where it's available;
+    otherwise, or if the file system doesn't support it, they're written from the mapped view.
+
+    Parameters:
+        source_fd (int): File descriptor of the source file.
+        target_fd (int): File descriptor of the target file, written at its current position.
+        view (memoryview): View of the mapped source file.
+        start (int): Offset of the first byte to copy.
+        end (int): Offset just past the last byte to copy.
+    """
+    if hasattr(os, 'sendfile'):
+        try:
+            while start < end:
+                sent = os.sendfile(target_fd, source_fd, start, end - start)
+                if not sent:
+                    break
+                start += sent
+        except OSError:
+            pass
+    write_all(target_fd, view[start:end])
+
 def replace_line_in_file(file_path, line_to_replace, new_line):
     """
-    Replace the specified line in the file with a new line and log each replacement.
+    Replace the specified line in the file with a new line and log how many lines were replaced.
+
+    The file is scanned through mmap for the line's text, so only the lines that contain it
+    are decoded and compared, and the spans between them are copied over as they are.
 
     Parameters:
         file_path (str): Path to the file.
         line_to_replace (str): The exact line to replace in the file.
         new_line (str): The new line to replace the old line with.
     """
+    logging.debug(f"Processing file: {file_path}")
+    target = line_to_replace.encode('utf-8')
+    replacement = new_line.encode('utf-8')
+    temp_path = None
     try:
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-
-        with open(file_path, 'w') as file:
-            for line in lines:
-                if line.strip() == line_to_replace:
-                    file.write(new_line + '\n')
-                    logging.info(f"Replaced line in file {file_path}: {line.strip()} with {new_line}")
-                else:
-                    file.write(line)
-
+        with open(file_path, 'rb') as file:
+            # Empty files can't be mapped and have nothing to replace
+            if os.fstat(file.fileno()).st_size == 0:
+                logging.info(f"Completed processing file: {file_path}")
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Files without the line anywhere are left as they are instead of being rewritten
+                index = mapped.find(target)
+                if index == -1:
+                    logging.info(f"Completed processing file: {file_path}")
+                    return
+
+                # Stream the file into a temporary file next to the original, then swap it in.
+                # Symlinks are resolved first so the link's target is edited rather than the link replaced
+                real_path = os.path.realpath(file_path)
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(real_path))
+                replaced = 0
+                position = 0
+                # The file object only closes fd; everything is written to fd directly
+                with os.fdopen(fd, 'wb', buffering=0), memoryview(mapped) as view:
+                    while index != -1:
+                        start = mapped.rfind(b'\n', 0, index) + 1
+                        end = mapped.find(b'\n', index)
+                        end = len(mapped) if end == -1 else end + 1
+                        line = mapped[start:end]
+                        if line.decode('utf-8', errors='replace').strip() == line_to_replace:
+                            copy_span(file.fileno(), fd, view, position, start)
+                            # Keep the line's own line ending so CRLF files stay consistent
+                            ending = b'\r\n' if line.endswith(b'\r\n') else b'\n'
+                            write_all(fd, replacement + ending)
+                            position = end
+                            replaced += 1
+                        index = mapped.find(target, end)
+                    copy_span(file.fileno(), fd, view, position, len(mapped))
+
+        # The text may only appear inside other lines, in which case nothing changes either
+        if not replaced:
+            os.remove(temp_path)
+            logging.info(f"Completed processing file: {file_path}")
+            return
+
+        shutil.copymode(real_path, temp_path)
+        os.replace(temp_path, real_path)
+        logging.info(f"Replaced {replaced} line(s) in file {file_path}: {line_to_replace} with {new_line}")
         logging.info(f"Completed processing file: {file_path}")
 
     except Exception as e:
         logging.error(f"Error processing file {file_path}: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
 
-def process_files(directory, extension, line_to_replace, new_line):
+def find_files(directory, extension):
+    """
+    Walk the directory tree with os.scandir and yield the files with the specified extension.
+
+    Parameters:
+        directory (str): Directory to search for files.
+        extension (str): File extension to filter by.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.name.endswith(extension):
+                    yield entry.path
+
+def process_files(directory, extension, line_to_replace, new_line, jobs=MAX_WORKERS):
     """
     Process all files in the directory with the specified extension,
     replacing the specified line with a new line in each file.
@@ -68,19 +199,31 @@ def process_files(directory, extension, line_to_replace, new_line):
         extension (str): File extension to filter by.
         line_to_replace (str): The exact line to replace in the files.
         new_line (str): The new line to replace the old line with.
+        jobs (int): Number of files to process concurrently.
     """
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(extension):
-                file_path = os.path.join(root, file)
-                logging.debug(f"Processing file: {file_path}")
-                replace_line_in_file(file_path, line_to_replace, new_line)
+    # Collect the files first so the work can be spread evenly over the threads
+    file_paths = list(find_files(directory, extension))
+
+    # Each file is independent and the work is I/O bound, so process them concurrently
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(replace_line_in_file, file_path, line_to_replace, new_line)
+                   for file_path in file_paths]
+        for future in futures:
+            future.result()  # Surface unexpected errors instead of dropping them
+
+def positive_int(value):
+    """Parse a command-line value as an integer greater than zero."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description="Replace an exact line in all files of a specified type in a directory.")
     parser.add_argument('--extension', help="File extension to filter by (e.g., .txt)")
     parser.add_argument('--line', help="The exact line to replace in the files")
     parser.add_argument('--new_line', help="The new line to replace the old line with")
+    parser.add_argument('--jobs', type=positive_int, default=MAX_WORKERS, help=f"Number of files to process concurrently (default: {MAX_WORKERS})")
 
     args = parser.parse_args()
 
@@ -94,7 +237,7 @@ def main():
     new_line = args.new_line or get_user_input("Enter the new line to replace the old line with", "New sample line")
 
     logging.info(f"Starting to process files in directory: {directory}")
-    process_files(directory, extension, line_to_replace, new_line)
+    process_files(directory, extension, line_to_replace, new_line, jobs=args.jobs)
     logging.info("Operation completed successfully.")
 
 if __name__ == '__main__':
@@ -4,24 +4,60 @@
 # finds all occurrences of a specified string in each file, and replaces them with a new string.
 # The extension, string to find, and new string can be provided as command-line arguments
 # or will be prompted from the user if not provided.
+# Many strings can be replaced in a single pass over each file with --patterns, which takes
+# a file of tab-separated "string<TAB>new string" lines.
 
 import os
 import argparse
+import atexit
 import logging
+import mmap
+import queue
+import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+CHUNK_SIZE = 1 << 20  # Bytes read from each file at a time
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Default number of files processed concurrently
+LOG_BUFFER_RECORDS = 1024  # Log records buffered before they are written to the log file
+# Prompts are only coloured on a terminal, so piped output stays free of escape codes
+PROMPT_COLOR = '\033[32m' if sys.stdout.isatty() else ''
+PROMPT_RESET = '\033[0m' if sys.stdout.isatty() else ''
 
 def setup_logging(script_name):
-    """Setup logging configuration."""
+    """
+    Setup logging configuration.
+
+    Records are formatted where they are logged and put on a queue, and a background
+    listener writes them to the file and console, so worker threads never wait on log I/O.
+    File records are buffered and written in batches; the console only shows INFO and up.
+    """
     log_dir = './logs'
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, f'{script_name}.log')
 
+    # Logging flushes and closes the buffer at exit, after the listener has been drained
+    file_handler = MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.ERROR,
+                                 target=logging.FileHandler(log_file))
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+
+    log_queue = queue.Queue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush the remaining records on exit
+
     logging.basicConfig(level=logging.DEBUG,
                         format='%(asctime)s - %(levelname)s - %(message)s',
-                        handlers=[
-                            logging.FileHandler(log_file),
-                            logging.StreamHandler()
-                        ])
+                        handlers=[QueueHandler(log_queue)])
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -29,33 +65,246 @@ def clear_screen():
 
 def get_user_input(prompt, default_value):
     """Prompt the user for input, returning a default value if none provided."""
-    user_input = input(f"\033[32m{prompt} (default: {default_value}): \033[0m").strip()
+    user_input = input(f"{PROMPT_COLOR}{prompt} (default: {default_value}): {PROMPT_RESET}").strip()
     return user_input or default_value
 
+def file_contains(file_path, target):
+    """
+    Check whether the file contains the target bytes anywhere, scanning it through mmap.
+
+    Parameters:
+        file_path (str): Path to the file.
+        target (bytes): The bytes to search for.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return False  # Empty files can't be mapped and have nothing to replace
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(target) != -1
+
+def file_contains_match(file_path, find_matches, longest):
+    """
+    Check whether the matcher finds anything in the file, scanning it through mmap a chunk at a time.
+
+    Parameters:
+        file_path (str): Path to the file.
+        find_matches (function): Matcher from find_strings.
+        longest (int): Length in bytes of the longest string the matcher can find.
+    """
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return False  # Empty files can't be mapped and have nothing to replace
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Chunks overlap so a match across the boundary between two of them is still found
+            for start in range(0, size, CHUNK_SIZE):
+                if next(find_matches(mapped[start:start + CHUNK_SIZE + longest - 1]), None):
+                    return True
+    return False
+
+def find_string(needle, replacement):
+    """
+    Build a matcher for a single string.
+
+    Parameters:
+        needle (bytes): The bytes to find.
+        replacement (bytes): The bytes to replace them with.
+
+    Returns:
+        function: Yields (start, end, replacement) for each non-overlapping match in a buffer.
+    """
+    def find_matches(buffer):
+        start = buffer.find(needle)
+        while start != -1:
+            yield start, start + len(needle), replacement
+            start = buffer.find(needle, start + len(needle))
+    return find_matches
+
+def find_strings(replacements):
+    """
+    Build a matcher that finds all of the strings in a single pass, preferring the longest
+    string where several match at the same position. An Aho-Corasick automaton is used when
+    pyahocorasick is installed, and a compiled alternation of the strings otherwise.
+
+    Parameters:
+        replacements (dict): Maps the bytes to find to the bytes to replace them with.
+
+    Returns:
+        function: Yields (start, end, replacement) for each non-overlapping match in a buffer.
+    """
+    if ahocorasick:
+        # The automaton works on str, so map bytes to code points one to one with latin-1
+        automaton = ahocorasick.Automaton()
+        for needle, replacement in replacements.items():
+            automaton.add_word(needle.decode('latin-1'), (len(needle), replacement))
+        automaton.make_automaton()
+
+        def find_matches(buffer):
+            # iter() reports every match, overlapping ones included; keep the leftmost, then
+            # longest, of those that start after the previous match, as the alternation does
+            matches = sorted((end - length + 1, -length, replacement)
+                             for end, (length, replacement) in automaton.iter(buffer.decode('latin-1')))
+            position = 0
+            for start, negative_length, replacement in matches:
+                if start >= position:
+                    position = start - negative_length
+                    yield start, position, replacement
+    else:
+        # Alternatives are tried in order, so longer strings go first
+        pattern = re.compile(b'|'.join(re.escape(needle) for needle in sorted(replacements, key=len, reverse=True)))
+
+        def find_matches(buffer):
+            for match in pattern.finditer(buffer):
+                yield match.start(), match.end(), replacements[match.group()]
+    return find_matches
+
+def replace_matches_in_file(file_path, find_matches, longest):
+    """
+    Stream the file through a temporary file next to the original in chunks, replacing each
+    match, and swap it in if anything was replaced.
+
+    Parameters:
+        file_path (str): Path to the file.
+        find_matches (function): Matcher from find_string or find_strings.
+        longest (int): Length in bytes of the longest string the matcher can find.
+
+    Returns:
+        int: The number of replacements made.
+    """
+    temp_path = None
+    try:
+        # Symlinks are resolved first so the link's target is edited rather than the link replaced
+        real_path = os.path.realpath(file_path)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(real_path))
+        count = 0
+        with os.fdopen(fd, 'wb') as temp_file, open(file_path, 'rb') as file:
+            carry = b''
+            while True:
+                chunk = file.read(CHUNK_SIZE)
+                buffer = carry + chunk
+                # A match starting at or after the cut could run into the next chunk,
+                # so that tail is carried over and searched again with more data
+                cut = len(buffer) - longest + 1 if chunk else len(buffer)
+                position = 0
+                for start, end, replacement in find_matches(buffer):
+                    if start >= cut:
+                        break
+                    temp_file.write(buffer[position:start])
+                    temp_file.write(replacement)
+                    position = end
+                    count += 1
+                keep = max(position, cut)
+                temp_file.write(buffer[position:keep])
+                carry = buffer[keep:]
+                if not chunk:
+                    break
+
+        if count:
+            shutil.copymode(real_path, temp_path)
+            os.replace(temp_path, real_path)
+        else:
+            os.remove(temp_path)
+        return count
+    except BaseException:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
 def replace_string_in_file(file_path, string_to_find, new_string):
     """
-    Replace all occurrences of the specified string in the file with a new string and log each replacement.
+    Replace all occurrences of the specified string in the file with a new string and log the replacement.
 
     Parameters:
         file_path (str): Path to the file.
         string_to_find (str): The string to find in the file.
         new_string (str): The new string to replace the old string with.
     """
+    logging.debug(f"Processing file: {file_path}")
+    needle = string_to_find.encode('utf-8')
     try:
-        with open(file_path, 'r') as file:
-            content = file.read()
+        # Files without the string are left as they are instead of being rewritten
+        if not file_contains(file_path, needle):
+            logging.debug(f"String not found in file {file_path}")
+            return
 
-        new_content = content.replace(string_to_find, new_string)
+        replace_matches_in_file(file_path, find_string(needle, new_string.encode('utf-8')), len(needle))
+        logging.info(f"Replaced string in file {file_path}: '{string_to_find}' with '{new_string}'")
 
-        with open(file_path, 'w') as file:
-            file.write(new_content)
+    except Exception as e:
+        logging.error(f"Error processing file {file_path}: {e}")
 
-        logging.info(f"Replaced string in file {file_path}: '{string_to_find}' with '{new_string}'")
+def replace_strings_in_file(file_path, find_matches, longest):
+    """
+    Replace every string from a patterns file in the file in a single pass and log how many were replaced.
+
+    Parameters:
+        file_path (str): Path to the file.
+        find_matches (function): Matcher from find_strings.
+        longest (int): Length in bytes of the longest string to find.
+    """
+    logging.debug(f"Processing file: {file_path}")
+    try:
+        # Files without any of the strings are left as they are instead of being rewritten
+        if not file_contains_match(file_path, find_matches, longest):
+            logging.debug(f"No strings found in file {file_path}")
+            return
+
+        count = replace_matches_in_file(file_path, find_matches, longest)
+        if count:
+            logging.info(f"Replaced {count} string(s) in file {file_path}")
+        else:
+            logging.debug(f"No strings found in file {file_path}")
 
     except Exception as e:
         logging.error(f"Error processing file {file_path}: {e}")
 
-def process_files(directory, extension, string_to_find, new_string):
+def load_replacements(patterns_file):
+    """
+    Load the strings to replace from a file of tab-separated "string<TAB>new string" lines.
+
+    Parameters:
+        patterns_file (str): Path to the patterns file.
+
+    Returns:
+        dict: Maps the encoded strings to find to their encoded replacements.
+    """
+    replacements = {}
+    with open(patterns_file, 'r', encoding='utf-8') as file:
+        for number, line in enumerate(file, 1):
+            line = line.rstrip('\r\n')
+            if not line:
+                continue
+            string_to_find, separator, new_string = line.partition('\t')
+            if not separator or not string_to_find:
+                logging.error(f"Skipping line {number} of {patterns_file}: expected 'string<TAB>new string'")
+                continue
+            replacements[string_to_find.encode('utf-8')] = new_string.encode('utf-8')
+    return replacements
+
+def find_files(directory, extension):
+    """
+    Walk the directory tree with os.scandir and yield the files with the specified extension.
+
+    Parameters:
+        directory (str): Directory to search for files.
+        extension (str): File extension to filter by.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.name.endswith(extension):
+                    yield entry.path
+
+def process_files(directory, extension, string_to_find, new_string, jobs=MAX_WORKERS, replacements=None):
     """
     Process all files in the directory with the specified extension,
     replacing the specified string with a new string in each file.
@@ -65,19 +314,43 @@ def process_files(directory, extension, string_to_find, new_string):
         extension (str): File extension to filter by.
         string_to_find (str): The string to find in the files.
         new_string (str): The new string to replace the old string with.
+        jobs (int): Number of files to process concurrently.
+        replacements (dict): Encoded strings to replace in a single pass, used instead of
+            string_to_find and new_string when given.
     """
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(extension):
-                file_path = os.path.join(root, file)
-                logging.debug(f"Processing file: {file_path}")
-                replace_string_in_file(file_path, string_to_find, new_string)
+    # Collect the files first so the work can be spread evenly over the threads
+    file_paths = list(find_files(directory, extension))
+
+    if replacements:
+        # Build the matcher once and share it between all of the files
+        find_matches = find_strings(replacements)
+        longest = max(len(needle) for needle in replacements)
+
+    # Each file is independent and the work is I/O bound, so process them concurrently
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        if replacements:
+            futures = [executor.submit(replace_strings_in_file, file_path, find_matches, longest)
+                       for file_path in file_paths]
+        else:
+            futures = [executor.submit(replace_string_in_file, file_path, string_to_find, new_string)
+                       for file_path in file_paths]
+        for future in futures:
+            future.result()  # Surface unexpected errors instead of dropping them
+
+def positive_int(value):
+    """Parse a command-line value as an integer greater than zero."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description="Replace a string in all files of a specified type in a directory.")
     parser.add_argument('--extension', help="File extension to filter by (e.g., .txt)")
     parser.add_argument('--string', help="The string to find in the files")
     parser.add_argument('--new_string', help="The new string to replace the old string with")
+    parser.add_argument('--patterns', help="File of tab-separated 'string<TAB>new string' lines to replace in a single pass")
+    parser.add_argument('--jobs', type=positive_int, default=MAX_WORKERS, help=f"Number of files to process concurrently (default: {MAX_WORKERS})")
 
     args = parser.parse_args()
 
@@ -87,11 +360,19 @@ def main():
 
     directory = os.getcwd()
     extension = args.extension or get_user_input("Enter the file extension to filter by", ".txt")
-    string_to_find = args.string or get_user_input("Enter the string to find", "old_string")
-    new_string = args.new_string or get_user_input("Enter the new string to replace the old string with", "new_string")
+    replacements = None
+    if args.patterns:
+        string_to_find = new_string = None
+        replacements = load_replacements(args.patterns)
+        if not replacements:
+            logging.error(f"No strings to replace found in {args.patterns}")
+            return
+    else:
+        string_to_find = args.string or get_user_input("Enter the string to find", "old_string")
+        new_string = args.new_string or get_user_input("Enter the new string to replace the old string with", "new_string")
 
     logging.info(f"Starting to process files in directory: {directory}")
-    process_files(directory, extension, string_to_find, new_string)
+    process_files(directory, extension, string_to_find, new_string, jobs=args.jobs, replacements=replacements)
     logging.info("Operation completed successfully.")
 
 if __name__ == '__main__':
@@ -7,9 +7,21 @@
 import os
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+SKIPPED_TAGS = ['script', 'style', 'template']  # Tags whose contents aren't page text
+MAX_WORKERS = 16  # URLs fetched concurrently
+REQUEST_TIMEOUT = 10  # Seconds to wait to connect, and between bytes of a response
+
 def setup_logging(script_name):
     """Setup logging configuration."""
     log_dir = './logs'
@@ -27,12 +39,29 @@ def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
-def scrape_content(url):
+def create_session():
+    """
+    Create a requests session whose connection pool has room for every worker thread,
+    so connections to the same host are reused instead of reopened for each URL.
+    Failed connections and transient server errors are retried with a short backoff.
+    
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def scrape_content(url, session):
     """
     Scrape content from a given webpage URL.
     
     Parameters:
         url (str): The URL of the webpage to scrape content from.
+        session (requests.Session): The session to send the request with.
     
     Returns:
         str: The scraped content.
@@ -40,16 +69,36 @@ def scrape_content(url):
     try:
         if not url.startswith('http://') and not url.startswith('https://'):
             url = 'https://' + url
-        response = requests.get(url)
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        content = soup.get_text()
+        if LexborHTMLParser:
+            # Parse with the native lexbor engine when it is installed
+            tree = LexborHTMLParser(response.text)
+            # Leave out scripts and styles, as get_text() does
+            tree.strip_tags(SKIPPED_TAGS)
+            content = tree.text()
+        else:
+            soup = BeautifulSoup(response.text, 'html.parser')
+            content = soup.get_text()
         logging.info(f"Scraped content from {url}")
         return content
     except requests.RequestException as e:
         logging.error(f"Error retrieving {url}: {e}")
         return ""
 
+class SanitizeTable(dict):
+    """
+    Translation table for str.translate that maps every character that isn't alphanumeric,
+    a space, a dot or an underscore to an underscore. Characters are classified the first
+    time they are seen and cached, so repeated characters are looked up in C.
+    """
+    def __missing__(self, code):
+        char = chr(code)
+        self[code] = replacement = char if char.isalnum() or char in (' ', '.', '_') else '_'
+        return replacement
+
+SANITIZE_TABLE = SanitizeTable()
+
 def sanitize_filename(filename):
     """
     Sanitize the filename to make it suitable for saving to the filesystem.
@@ -60,7 +109,7 @@ def sanitize_filename(filename):
     Returns:
         str: The sanitized filename.
     """
-    return "".join(c if c.isalnum() or c in (' ', '.', '_') else '_' for c in filename)
+    return filename.translate(SANITIZE_TABLE)
 
 def save_content_to_file(content, script_name, url):
     """
@@ -82,6 +131,19 @@ def save_content_to_file(content, script_name, url):
     except Exception as e:
         logging.error(f"Error writing to file: {e}")
 
+def scrape_and_save(url, session, script_name):
+    """
+    Scrape a single URL and save its content, if any.
+    
+    Parameters:
+        url (str): The URL to scrape.
+        session (requests.Session): The session to send the request with.
+        script_name (str): The name of the script.
+    """
+    content = scrape_content(url, session)
+    if content:
+        save_content_to_file(content, script_name, url)
+
 def main():
     script_name = os.path.basename(__file__).split('.')[0]
     setup_logging(script_name)
@@ -105,14 +167,13 @@ def main():
     os.makedirs(args.output_dir, exist_ok=True)
 
     with open(url_file, 'r') as file:
-        urls = file.readlines()
-
-    for url in urls:
-        url = url.strip()
-        if url:
-            content = scrape_content(url)
-            if content:
-                save_content_to_file(content, script_name, url)
+        urls = [url.strip() for url in file if url.strip()]
+
+    # The work is dominated by waiting on the network, so fetch the URLs concurrently
+    with create_session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(scrape_and_save, url, session, script_name) for url in urls]
+        for future in futures:
+            future.result()  # Surface unexpected errors as the sequential loop did
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
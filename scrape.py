@@ -7,8 +7,16 @@
 import os
 import logging
 import argparse
+from html.parser import HTMLParser
 import requests
-from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+SKIPPED_TAGS = ['script', 'style', 'template']  # Tags whose contents aren't page text
+STREAM_CHUNK_SIZE = 1 << 16  # Bytes of the page downloaded and fed to the text extractor at a time
 
 def setup_logging(script_name):
     """Setup logging configuration."""
@@ -27,6 +35,32 @@ def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
+class TextExtractor(HTMLParser):
+    """
+    Collect the text of a page as it is fed in, without building a document tree.
+    Like BeautifulSoup's get_text(), the contents of script, style and template tags are left out.
+    """
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+    def text(self):
+        """Return the text collected so far."""
+        return ''.join(self.parts)
+
 def scrape_content(url):
     """
     Scrape content from a given webpage URL.
@@ -40,16 +74,43 @@ def scrape_content(url):
     try:
         if not url.startswith('http://') and not url.startswith('https://'):
             url = 'https://' + url
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        content = soup.get_text()
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            if LexborHTMLParser:
+                # Parse with the native lexbor engine when it is installed
+                tree = LexborHTMLParser(response.text)
+                # Leave out scripts and styles, as get_text() does
+                tree.strip_tags(SKIPPED_TAGS)
+                content = tree.text()
+            else:
+                # Otherwise extract the text while the page downloads, so neither the whole
+                # page nor a parse tree of it is held in memory
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                extractor = TextExtractor()
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE, decode_unicode=True):
+                    extractor.feed(chunk)
+                extractor.close()
+                content = extractor.text()
         logging.info(f"Scraped content from {url}")
         return content
     except requests.RequestException as e:
         logging.error(f"Error retrieving {url}: {e}")
         return ""
 
+class SanitizeTable(dict):
+    """
+    Translation table for str.translate that maps every character that isn't alphanumeric,
+    a space, a dot or an underscore to an underscore. Characters are classified the first
+    time they are seen and cached, so repeated characters are looked up in C.
+    """
+    def __missing__(self, code):
+        char = chr(code)
+        self[code] = replacement = char if char.isalnum() or char in (' ', '.', '_') else '_'
+        return replacement
+
+SANITIZE_TABLE = SanitizeTable()
+
 def sanitize_filename(filename):
     """
     Sanitize the filename to make it suitable for saving to the filesystem.
@@ -60,7 +121,7 @@ def sanitize_filename(filename):
     Returns:
         str: The sanitized filename.
     """
-    return "".join(c if c.isalnum() or c in (' ', '.', '_') else '_' for c in filename)
+    return filename.translate(SANITIZE_TABLE)
 
 def save_content_to_file(content, script_name, url):
     """
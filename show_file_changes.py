@@ -9,6 +9,8 @@ import os
 import subprocess
 import argparse
 
+COMMIT_PREFIX = 'commit '  # Starts the header line of each commit in the git log output
+
 def get_commit_history(file_path):
     """
     Get the commit history for a specific file.
@@ -33,13 +35,49 @@ def show_file_changes(file_path):
         file_path (str): The path to the file.
     """
     commit_hashes = get_commit_history(file_path)
-    for commit_hash in commit_hashes:
-        command = ["git", "show", f"{commit_hash}:{file_path}"]
-        result = subprocess.run(command, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"Error showing changes for commit {commit_hash}: {result.stderr}")
-        print(f"Commit: {commit_hash}")
-        print(result.stdout)
+    # A single git cat-file process serves the file's contents at every commit,
+    # instead of starting a git show per commit
+    command = ["git", "cat-file", "--batch"]
+    with subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE) as cat_file:
+        for commit_hash in commit_hashes:
+            cat_file.stdin.write(f"{commit_hash}:{file_path}\n".encode('utf-8'))
+            cat_file.stdin.flush()
+            # Each object comes back as "<hash> <type> <size>", the contents and a newline,
+            # or as "<commit>:<path> missing" when the path isn't in that commit
+            header = cat_file.stdout.readline().decode('utf-8').rstrip('\n')
+            if header.endswith((' missing', ' ambiguous')):
+                raise Exception(f"Error showing changes for commit {commit_hash}: {header}")
+            content = cat_file.stdout.read(int(header.rsplit(' ', 1)[1]) + 1)[:-1]
+            print(f"Commit: {commit_hash}")
+            print(content.decode('utf-8', errors='replace'))
+            print("-" * 80)
+
+def show_file_diffs(file_path):
+    """
+    Show the diff of each commit affecting the specified file.
+
+    All of the diffs are streamed from a single git log process instead of running
+    a git command per commit.
+
+    Parameters:
+        file_path (str): The path to the file.
+    """
+    command = ["git", "log", "--follow", "-p", f"--format={COMMIT_PREFIX}%H", "--", file_path]
+    in_commit = False
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as process:
+        for line in process.stdout:
+            # Diff lines never start with the prefix, so it only matches commit headers
+            if line.startswith(COMMIT_PREFIX):
+                if in_commit:
+                    print("-" * 80)
+                in_commit = True
+                print(f"Commit: {line[len(COMMIT_PREFIX):].strip()}")
+            else:
+                print(line, end='')
+        error = process.stderr.read()
+    if process.returncode != 0:
+        raise Exception(f"Error getting commit history: {error}")
+    if in_commit:
         print("-" * 80)
 
 def main():
@@ -48,6 +86,7 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Display all changes made to a specific file in a Git repository.")
     parser.add_argument("file_path", help="The path to the file.")
+    parser.add_argument("-p", "--patch", action="store_true", help="Show the diff of each commit instead of the file's contents.")
     
     args = parser.parse_args()
     file_path = args.file_path
@@ -57,7 +96,10 @@ def main():
         return
     
     try:
-        show_file_changes(file_path)
+        if args.patch:
+            show_file_diffs(file_path)
+        else:
+            show_file_changes(file_path)
     except Exception as e:
         print(f"An error occurred: {e}")
 
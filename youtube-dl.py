@@ -8,7 +8,13 @@ and then downloads the video using the highest resolution available.
 
 import os
 import logging
-from pytube import YouTube
+import shutil
+from yt_dlp import YoutubeDL
+
+# Merging separate video and audio streams needs ffmpeg; without it, take the best single file
+VIDEO_FORMAT = 'bv*+ba/b' if shutil.which('ffmpeg') else 'b'
+CONCURRENT_FRAGMENTS = 8  # Fragments of a segmented stream downloaded in parallel
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024  # Request size for plain HTTP downloads, to dodge per-connection throttling
 
 def setup_logging(script_name):
     """
@@ -40,11 +46,17 @@ def download_video(url, path):
         url (str): The URL of the YouTube video.
         path (str): The directory path to save the downloaded video.
     """
+    options = {
+        'format': VIDEO_FORMAT,
+        'outtmpl': os.path.join(path, '%(title)s.%(ext)s'),
+        'concurrent_fragment_downloads': CONCURRENT_FRAGMENTS,
+        'http_chunk_size': HTTP_CHUNK_SIZE,
+        'retries': 10,
+    }
     try:
-        yt = YouTube(url)
-        stream = yt.streams.get_highest_resolution()
-        stream.download(output_path=path)
-        logging.info(f"Downloaded: {yt.title}")
+        with YoutubeDL(options) as ydl:
+            info = ydl.extract_info(url, download=True)
+        logging.info(f"Downloaded: {info.get('title')}")
     except Exception as e:
         logging.error(f"Error: {e}")
 